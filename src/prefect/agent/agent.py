@@ -705,7 +705,8 @@ class Agent:
             - flow_run (GraphQLResult): A GraphQLResult flow run object
         """
         # Set flow run state to `Submitted` if it is currently `Scheduled`
-        if StateSchema().load(flow_run.serialized_state).is_scheduled():
+        flow_run_state = StateSchema().load(flow_run.serialized_state)
+        if flow_run_state.is_scheduled():
 
             self.logger.debug(
                 f"Updating flow run {flow_run.id} state from Scheduled -> Submitted..."
@@ -715,26 +716,30 @@ class Agent:
                 version=flow_run.version,
                 state=Submitted(
                     message="Submitted for execution",
-                    state=StateSchema().load(flow_run.serialized_state),
+                    state=flow_run_state,
                 ),
             )
 
-        # Set task run states to `Submitted` if they are currently `Scheduled`
-        task_runs_updated = 0
+        # Set task run states to `Submitted` if they are currently `Scheduled`, all in
+        # a single request
+        task_run_states = []
         for task_run in flow_run.task_runs:
-            if StateSchema().load(task_run.serialized_state).is_scheduled():
-                task_runs_updated += 1
-                self.client.set_task_run_state(
-                    task_run_id=task_run.id,
-                    version=task_run.version,
-                    state=Submitted(
-                        message="Submitted for execution.",
-                        state=StateSchema().load(task_run.serialized_state),
-                    ),
+            task_run_state = StateSchema().load(task_run.serialized_state)
+            if task_run_state.is_scheduled():
+                task_run_states.append(
+                    dict(
+                        task_run_id=task_run.id,
+                        version=task_run.version,
+                        state=Submitted(
+                            message="Submitted for execution.",
+                            state=task_run_state,
+                        ),
+                    )
                 )
-        if task_runs_updated:
+        if task_run_states:
+            self.client.set_task_run_states(task_run_states)
             self.logger.debug(
-                f"Updated {task_runs_updated} task runs states for flow run "
+                f"Updated {len(task_run_states)} task runs states for flow run "
                 f"{flow_run.id} from  Scheduled -> Submitted"
             )
 
@@ -376,6 +376,10 @@ class FlowRunView:
         # is done running
         self._task_run_ids: Optional[List[str]] = None
 
+        # Cached count of task runs for this flow run, only cached if the flow is done
+        # running
+        self._task_run_count: Optional[int] = None
+
         # Cached value of flow metadata
         self._flow: Optional[FlowView] = None
 
@@ -712,7 +716,7 @@ class FlowRunView:
         Returns:
             A list of TaskRunView objects
         """
-        if len(self.get_task_run_ids()) > 1000:
+        if self._get_task_run_count() > 1000:
             raise ValueError(
                 "Refusing to `get_all_task_runs` for a flow with more than 1000 tasks. "
                 "Please load the tasks you are interested in individually."
@@ -737,6 +741,53 @@ class FlowRunView:
 
         return task_runs
 
+    def _get_task_run_count(self) -> int:
+        """
+        Get the number of task runs associated with this flow run. Uses the cached task
+        run ids if they have been loaded, otherwise the backend is asked for a count so
+        the ids do not have to be retrieved just to be counted. The count is cached
+        once the flow run is finished.
+
+        Returns:
+            The number of task runs in this flow run
+        """
+        if self._task_run_ids:
+            return len(self._task_run_ids)
+
+        if self._task_run_count is not None:
+            return self._task_run_count
+
+        client = prefect.Client()
+
+        count_query = {
+            "query": {
+                with_args(
+                    "task_run_aggregate",
+                    {
+                        "where": {
+                            "flow_run_id": {"_eq": self.flow_run_id},
+                        }
+                    },
+                ): {"aggregate": {"count"}}
+            }
+        }
+        result = client.graphql(count_query)
+        task_run_aggregate = result.get("data", {}).get("task_run_aggregate", None)
+
+        if task_run_aggregate is None:
+            raise ValueError(
+                f"Received bad result while counting task runs for flow run "
+                f"{self.flow_run_id}: {result}"
+            )
+
+        task_run_count = task_run_aggregate["aggregate"]["count"]
+
+        # If the flow run is done, we can safely cache this value
+        if self.state.is_finished():
+            self._task_run_count = task_run_count
+
+        return task_run_count
+
     def get_task_run_ids(self) -> List[str]:
         """
         Get all task run ids associated with this flow run. Lazily loaded at call time
@@ -1,4 +1,4 @@
-from typing import Any, List, Iterator
+from typing import Any, Dict, List, Iterator
 
 from prefect import Client
 from prefect.engine.state import Scheduled, State
@@ -180,11 +180,20 @@ class TaskRunView:
                 "Only built-in `Result` types are supported."
             )
 
-    def iter_mapped(self) -> Iterator["TaskRunView"]:
+    def iter_mapped(self, batch_size: int = 100) -> Iterator["TaskRunView"]:
         """
         Iterate over the results of a mapped task, yielding a `TaskRunView` for each map
-        index. This query is not performed in bulk so the results can be lazily
-        consumed. If you want all of the task results at once, use `result` instead.
+        index. Child task runs are queried in batches of `batch_size` so the results can
+        be lazily consumed. If you want all of the task results at once, use `result`
+        instead.
+
+        Args:
+            - batch_size (optional): The number of child task runs to query at a time;
+                must be at least 1
+
+        Raises:
+            - TypeError: if the task run is not mapped
+            - ValueError: if `batch_size` is less than 1
 
         Yields:
             A `TaskRunView` for each mapped item
@@ -194,23 +203,30 @@ class TaskRunView:
                 f"Task run {self.task_run_id!r} ({self.task_slug}) is not a "
                 "mapped task."
             )
+        if batch_size < 1:
+            raise ValueError(f"`batch_size` must be at least 1; got {batch_size!r}.")
 
-        # Generate a where clause given the map index
+        # Generate a where clause for the batch starting at the given map index
         where = lambda index: {
             "task": {"slug": {"_eq": self.task_slug}},
             "flow_run_id": {"_eq": self.flow_run_id},
-            "map_index": {"_eq": index},
+            "map_index": {"_gte": index},
         }
         map_index = 0
         while True:  # Iterate until we are out of child task runs
-            task_run_data = self._query_for_task_run(
-                where=where(map_index), error_on_empty=False
+            task_runs = self._query_for_task_runs(
+                where=where(map_index),
+                order_by={"map_index": EnumValue("asc")},
+                limit=batch_size,
+                error_on_empty=False,
             )
-            if not task_run_data:
-                break
 
-            yield self._from_task_run_data(task_run_data)
-            map_index += 1
+            for task_run_data in task_runs:
+                yield self._from_task_run_data(task_run_data)
+
+            if len(task_runs) < batch_size:
+                break
+            map_index = task_runs[-1]["map_index"] + 1
 
     @classmethod
     def _from_task_run_data(cls, task_run: dict) -> "TaskRunView":
@@ -321,6 +337,7 @@ class TaskRunView:
     def _query_for_task_runs(
         where: dict,
         order_by: dict = None,
+        limit: int = None,
         error_on_empty: bool = True,
     ) -> List[dict]:
         """
@@ -331,6 +348,7 @@ class TaskRunView:
             - where (required): The Hasura `where` clause to filter by
             - order_by (optional): An optional Hasura `order_by` clause to order results
                 by.
+            - limit (optional): An optional maximum number of task runs to return
             - error_on_empty (optional): If `True` and no tasks are found, a `ValueError`
                 will be raised.
 
@@ -339,9 +357,11 @@ class TaskRunView:
         """
         client = Client()
 
-        query_args = {"where": where}
+        query_args = {"where": where}  # type: Dict[str, Any]
         if order_by is not None:
             query_args["order_by"] = order_by
+        if limit is not None:
+            query_args["limit"] = limit
 
         query = {
             "query": {
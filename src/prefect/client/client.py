@@ -3,6 +3,7 @@ import json
 import os
 import random
 import re
+import threading
 import time
 import uuid
 import warnings
@@ -14,6 +15,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Tuple,
     Union,
     cast,
     Mapping,
@@ -53,6 +55,39 @@ if TYPE_CHECKING:
     import requests
 JSONLike = Union[bool, dict, list, str, int, float, None]
 
+# GraphQL documents for mutations that are sent on every state change or log batch;
+# they never vary, so they are built from their dicts once here. `Client.graphql`
+# still normalizes the resulting strings on each call, which is cheaper than parsing
+# the dicts
+
+SET_FLOW_RUN_STATES_MUTATION = parse_graphql(
+    {
+        "mutation($input: set_flow_run_states_input!)": {
+            "set_flow_run_states(input: $input)": {
+                "states": {"id", "status", "message"}
+            }
+        }
+    }
+)
+
+SET_TASK_RUN_STATES_MUTATION = parse_graphql(
+    {
+        "mutation($input: set_task_run_states_input!)": {
+            "set_task_run_states(input: $input)": {
+                "states": {"id", "status", "message"}
+            }
+        }
+    }
+)
+
+WRITE_RUN_LOGS_MUTATION = parse_graphql(
+    {
+        "mutation($input: write_run_logs_input!)": {
+            "write_run_logs(input: $input)": {"success"}
+        }
+    }
+)
+
 # type definitions for GraphQL results
 
 
@@ -120,6 +155,13 @@ class Client:
         self._refresh_token = None
         self._access_token_expires_at = pendulum.now()
         self._attached_headers = {}  # type: Dict[str, str]
+        # Sessions are kept per thread since `requests.Session` is not guaranteed to be
+        # thread-safe and a client may be shared by many threads (e.g. an agent's
+        # deployment workers and heartbeat)
+        self._local = threading.local()
+        # Tenant slugs keyed by (as_user, tenant id) so switching tenants never
+        # returns a stale slug
+        self._tenant_slugs = {}  # type: Dict[Tuple[bool, Optional[str]], str]
         self.logger = create_diagnostic_logger("Diagnostics")
 
         # Hard-code the auth filepath location
@@ -557,18 +599,29 @@ class Client:
         # TODO: It looks like this code is never reached because errors are raised
         #       in self._send_request by default
         if raise_on_error and "errors" in result:
-            if "UNAUTHENTICATED" in str(result["errors"]):
-                raise AuthorizationError(result["errors"])
-            elif "Malformed Authorization header" in str(result["errors"]):
-                raise AuthorizationError(result["errors"])
-            elif (
-                result["errors"][0].get("extensions", {}).get("code")
-                == "VERSION_LOCKING_ERROR"
-            ):
-                raise VersionLockMismatchSignal(result["errors"])
-            raise ClientError(result["errors"])
-        else:
-            return GraphQLResult(result)  # type: ignore
+            self._raise_for_graphql_errors(result["errors"])
+        return GraphQLResult(result)  # type: ignore
+
+    @staticmethod
+    def _raise_for_graphql_errors(errors: Any) -> None:
+        """
+        Raise the exception matching the `errors` returned by a GraphQL request
+
+        Args:
+            - errors (list): the `errors` of a GraphQL response
+
+        Raises:
+            - AuthorizationError: if the request was not authorized
+            - VersionLockMismatchSignal: if the request failed version locking
+            - ClientError: for any other errors
+        """
+        if "UNAUTHENTICATED" in str(errors):
+            raise AuthorizationError(errors)
+        elif "Malformed Authorization header" in str(errors):
+            raise AuthorizationError(errors)
+        elif errors[0].get("extensions", {}).get("code") == "VERSION_LOCKING_ERROR":
+            raise VersionLockMismatchSignal(errors)
+        raise ClientError(errors)
 
     def _send_request(
         self,
@@ -703,10 +756,6 @@ class Client:
         if token is None:
             token = self.get_auth_token()
 
-        # 'import requests' is expensive time-wise, we should do this just-in-time to keep
-        # the 'import prefect' time low
-        import requests
-
         url = urljoin(server, path.lstrip("/")).rstrip("/")
 
         params = params or {}
@@ -725,15 +774,7 @@ class Client:
         if self._attached_headers:
             headers.update(self._attached_headers)
 
-        session = requests.Session()
-        retry_total = 6 if prefect.config.backend == "cloud" else 1
-        retries = requests.packages.urllib3.util.retry.Retry(
-            total=retry_total,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            method_whitelist=["DELETE", "GET", "POST"],
-        )
-        session.mount("https://", requests.adapters.HTTPAdapter(max_retries=retries))
+        session = self._get_session()
         response = self._send_request(
             session=session, method=method, url=url, params=params, headers=headers
         )
@@ -769,6 +810,48 @@ class Client:
 
         return response
 
+    def _get_session(self) -> "requests.Session":
+        """
+        Get the session used to send requests to the API, creating it on first use.
+
+        The session is kept for the lifetime of the client so its connection pool can
+        reuse open connections instead of establishing a new connection (and TLS
+        handshake) for every request. Each thread using the client gets its own session.
+
+        Returns:
+            - requests.Session: the session for this client in the current thread
+        """
+        # 'import requests' is expensive time-wise, we should do this just-in-time to keep
+        # the 'import prefect' time low
+        import requests
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            retry_total = 6 if prefect.config.backend == "cloud" else 1
+            retries = requests.packages.urllib3.util.retry.Retry(
+                total=retry_total,
+                backoff_factor=1,
+                status_forcelist=[500, 502, 503, 504],
+                method_whitelist=["DELETE", "GET", "POST"],
+            )
+            session.mount(
+                "https://", requests.adapters.HTTPAdapter(max_retries=retries)
+            )
+            self._local.session = session
+
+        return session
+
+    def __getstate__(self) -> dict:
+        # thread-local sessions cannot be pickled; they are recreated on first use
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
     def attach_headers(self, headers: dict) -> None:
         """
         Set headers to be attached to this Client
@@ -1195,13 +1278,13 @@ class Client:
             }
         }
 
-        # tasks in batches of 500
-        start = 0
+        # tasks and edges in batches of 500; only non-empty batches are sent so a
+        # flow without edges (or with an exact multiple of 500 tasks) does not make
+        # an extra request that registers nothing
         batch_size = 500
-        stop = start + batch_size
 
-        while start <= len(serialized_tasks):
-            task_batch = serialized_tasks[start:stop]
+        for start in range(0, len(serialized_tasks), batch_size):
+            task_batch = serialized_tasks[start : start + batch_size]
             inputs = dict(
                 flow_id=flow_id,
                 serialized_tasks=task_batch,
@@ -1210,16 +1293,9 @@ class Client:
                 task_mutation,
                 variables=dict(input=inputs),
             )
-            start = stop
-            stop += batch_size
-
-        # edges in batches of 500
-        start = 0
-        batch_size = 500
-        stop = start + batch_size
 
-        while start <= len(serialized_edges):
-            edge_batch = serialized_edges[start:stop]
+        for start in range(0, len(serialized_edges), batch_size):
+            edge_batch = serialized_edges[start : start + batch_size]
             inputs = dict(
                 flow_id=flow_id,
                 serialized_edges=edge_batch,
@@ -1228,8 +1304,6 @@ class Client:
                 edge_mutation,
                 variables=dict(input=inputs),
             )
-            start = stop
-            stop += batch_size
 
         # finally, if requested, we turn on the schedule
         if set_schedule_active:
@@ -1325,7 +1399,8 @@ class Client:
 
     def get_default_tenant_slug(self, as_user: bool = False) -> str:
         """
-        Get the default tenant slug for the currently authenticated user
+        Get the default tenant slug for the currently authenticated user. The slug is
+        cached on the client for the current tenant.
 
         Args:
             - as_user (bool, optional):
@@ -1335,6 +1410,17 @@ class Client:
         Returns:
             - str: the slug of the current default tenant for this user
         """
+        cache_key = (as_user, self._tenant_id)
+        if cache_key not in self._tenant_slugs:
+            self._tenant_slugs[cache_key] = self._get_default_tenant_slug(
+                as_user=as_user
+            )
+        return self._tenant_slugs[cache_key]
+
+    def _get_default_tenant_slug(self, as_user: bool = False) -> str:
+        """
+        Query for the default tenant slug; see `get_default_tenant_slug`
+        """
         if as_user:
             query = {
                 "query": {"user": {"default_membership": {"tenant": "slug"}}}
@@ -1496,6 +1582,100 @@ class Client:
                 "create_flow_run(input: $input)": {"id": True}
             }
         }
+        inputs = self._get_flow_run_inputs(
+            flow_id=flow_id,
+            context=context,
+            parameters=parameters,
+            run_config=run_config,
+            labels=labels,
+            scheduled_start_time=scheduled_start_time,
+            idempotency_key=idempotency_key,
+            run_name=run_name,
+            version_group_id=version_group_id,
+        )
+        res = self.graphql(create_mutation, variables=dict(input=inputs))
+        return res.data.create_flow_run.id  # type: ignore
+
+    def create_flow_runs(self, flow_runs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several flow runs with a single request. Each item of `flow_runs` is a
+        dictionary of the keyword arguments accepted by `Client.create_flow_run`; all of
+        the runs are created by one GraphQL mutation rather than one request per run.
+
+        The flow runs are not created atomically: if some of them are rejected the
+        others are still created, and the raised `ClientError` lists the IDs of the
+        flow runs that were created. Pass an `idempotency_key` for each flow run so
+        that retrying the batch does not create duplicates.
+
+        Args:
+            - flow_runs (List[dict]): a list of `create_flow_run` keyword arguments, one
+                dictionary for each flow run to create
+
+        Returns:
+            - List[str]: the IDs of the newly-created flow runs, in the order they were
+                provided
+
+        Raises:
+            - ValueError: if any of the flow runs is missing both a `flow_id` and a
+                `version_group_id`
+            - ClientError: if the GraphQL mutation is bad for any reason, including when
+                only some of the flow runs could be created
+        """
+        if not flow_runs:
+            return []
+
+        # every flow run gets its own aliased `create_flow_run` field and input
+        # variable so the whole batch can be sent as one document
+        variables = {}  # type: Dict[str, Any]
+        definitions = []
+        fields = {}
+        for i, flow_run in enumerate(flow_runs):
+            variables[f"input_{i}"] = self._get_flow_run_inputs(**flow_run)
+            definitions.append(f"$input_{i}: create_flow_run_input!")
+            fields[f"flow_run_{i}: create_flow_run(input: $input_{i})"] = {"id": True}
+
+        create_mutation = {"mutation({})".format(", ".join(definitions)): fields}
+        res = self.graphql(create_mutation, variables=variables, raise_on_error=False)
+
+        # the aliased mutations are not atomic, so collect the runs that were created
+        # even if others failed
+        data = res.get("data") or {}
+        flow_run_ids = [
+            data[f"flow_run_{i}"].id if data.get(f"flow_run_{i}") else None
+            for i in range(len(flow_runs))
+        ]
+
+        if "errors" in res:
+            created = [
+                (i, flow_run_id)
+                for i, flow_run_id in enumerate(flow_run_ids)
+                if flow_run_id is not None
+            ]
+            if not created:
+                self._raise_for_graphql_errors(res.errors)
+            raise ClientError(
+                f"Created {len(created)} of {len(flow_runs)} flow runs; IDs of the "
+                f"created flow runs by position: {dict(created)}. Errors: {res.errors}"
+            )
+
+        return flow_run_ids
+
+    def _get_flow_run_inputs(
+        self,
+        flow_id: str = None,
+        context: dict = None,
+        parameters: dict = None,
+        run_config: RunConfig = None,
+        labels: List[str] = None,
+        scheduled_start_time: datetime.datetime = None,
+        idempotency_key: str = None,
+        run_name: str = None,
+        version_group_id: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the `create_flow_run_input` payload for a single flow run; see
+        `Client.create_flow_run` for a description of the arguments.
+        """
         if not flow_id and not version_group_id:
             raise ValueError("One of flow_id or version_group_id must be provided")
 
@@ -1519,8 +1699,7 @@ class Client:
             inputs["scheduled_start_time"] = scheduled_start_time.isoformat()
         if run_name is not None:
             inputs["flow_run_name"] = run_name
-        res = self.graphql(create_mutation, variables=dict(input=inputs))
-        return res.data.create_flow_run.id  # type: ignore
+        return inputs
 
     def get_flow_run_info(self, flow_run_id: str) -> FlowRunInfoResult:
         """
@@ -1681,18 +1860,10 @@ class Client:
         Raises:
             - ClientError: if the GraphQL mutation is bad for any reason
         """
-        mutation = {
-            "mutation($input: set_flow_run_states_input!)": {
-                "set_flow_run_states(input: $input)": {
-                    "states": {"id", "status", "message"}
-                }
-            }
-        }
-
         serialized_state = state.serialize()
 
         result = self.graphql(
-            mutation,
+            SET_FLOW_RUN_STATES_MUTATION,
             variables=dict(
                 input=dict(
                     states=[
@@ -1904,41 +2075,65 @@ class Client:
         Returns:
             - State: the state the current task run should be considered in
         """
-        mutation = {
-            "mutation($input: set_task_run_states_input!)": {
-                "set_task_run_states(input: $input)": {
-                    "states": {"id", "status", "message"}
-                }
-            }
-        }
+        return self.set_task_run_states(
+            [dict(task_run_id=task_run_id, state=state, version=version)]
+        )[0]
 
-        serialized_state = state.serialize()
+    def set_task_run_states(
+        self, task_run_states: List[Dict[str, Any]]
+    ) -> List["prefect.engine.state.State"]:
+        """
+        Sets new states for several task runs with a single request.
+
+        Args:
+            - task_run_states (List[dict]): a list of dicts with the keyword arguments
+                accepted by `set_task_run_state` (`task_run_id`, `state` and optionally
+                `version`) for each task run
+
+        Raises:
+            - ClientError: if the GraphQL mutation is bad for any reason
+
+        Returns:
+            - List[State]: the states the task runs should be considered in, in the same
+                order as `task_run_states`
+        """
+        if not task_run_states:
+            return []
 
         result = self.graphql(
-            mutation,
+            SET_TASK_RUN_STATES_MUTATION,
             variables=dict(
                 input=dict(
                     states=[
                         dict(
-                            state=serialized_state,
-                            task_run_id=task_run_id,
-                            version=version,
+                            state=task_run_state["state"].serialize(),
+                            task_run_id=task_run_state["task_run_id"],
+                            version=task_run_state.get("version"),
                         )
+                        for task_run_state in task_run_states
                     ]
                 )
             ),
         )  # type: Any
-        state_payload = result.data.set_task_run_states.states[0]
-        if state_payload.status == "QUEUED":
-            # If appropriate, the state attribute of the Queued state can be
-            # set by the caller of this method
-            return prefect.engine.state.Queued(
-                message=state_payload.get("message"),
-                start_time=pendulum.now("UTC").add(
-                    seconds=prefect.context.config.cloud.queue_interval
-                ),
-            )
-        return state
+
+        states = []  # type: List[prefect.engine.state.State]
+        for task_run_state, state_payload in zip(
+            task_run_states, result.data.set_task_run_states.states
+        ):
+            if state_payload.status == "QUEUED":
+                # If appropriate, the state attribute of the Queued state can be
+                # set by the caller of this method
+                states.append(
+                    prefect.engine.state.Queued(
+                        message=state_payload.get("message"),
+                        start_time=pendulum.now("UTC").add(
+                            seconds=prefect.context.config.cloud.queue_interval
+                        ),
+                    )
+                )
+            else:
+                states.append(task_run_state["state"])
+        return states
 
     def set_secret(self, name: str, value: Any) -> None:
         """
@@ -2052,14 +2247,8 @@ class Client:
         Raises:
             - ValueError: if uploading the logs fail
         """
-        mutation = {
-            "mutation($input: write_run_logs_input!)": {
-                "write_run_logs(input: $input)": {"success"}
-            }
-        }
-
         result = self.graphql(
-            mutation, variables=dict(input=dict(logs=logs))
+            WRITE_RUN_LOGS_MUTATION, variables=dict(input=dict(logs=logs))
         )  # type: Any
 
         if not result.data.write_run_logs.success:
@@ -134,6 +134,8 @@ class Edge:
         return f"<{desc}: {self.upstream_task.name} to {self.downstream_task.name}>"
 
     def __eq__(self, other: "Edge") -> bool:  # type: ignore
+        if self is other:
+            return True
         if type(self) == type(other):
             attrs = ["upstream_task", "downstream_task", "key", "mapped", "flattened"]
             return all(getattr(self, a) == getattr(other, a) for a in attrs)
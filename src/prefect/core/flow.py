@@ -61,19 +61,26 @@ def cache(method: Callable) -> Callable:
     If the hash is different, it invalidates the cache.
     """
 
+    signature = inspect.signature(method)
+
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs):  # type: ignore
 
-        cache_check = dict(
-            tasks=self.tasks.copy(),
-            edges=self.edges.copy(),
-            reference_tasks=copy.copy(self._reference_tasks),
-        )
-        if any(self._cache.get(k) != v for k, v in cache_check.items()):
+        # compare against the live attributes and only take copies when the cache is
+        # invalidated, so cache hits do not copy every task and edge
+        if (
+            self._cache.get("tasks") != self.tasks
+            or self._cache.get("edges") != self.edges
+            or self._cache.get("reference_tasks") != self._reference_tasks
+        ):
             self._cache.clear()
-            self._cache.update(cache_check)
+            self._cache.update(
+                tasks=self.tasks.copy(),
+                edges=self.edges.copy(),
+                reference_tasks=copy.copy(self._reference_tasks),
+            )
 
-        callargs = inspect.signature(method).bind(self, *args, **kwargs).arguments
+        callargs = signature.bind(self, *args, **kwargs).arguments
         key = (method.__name__, tuple(callargs.items())[1:])
         if key not in self._cache:
             self._cache[key] = method(self, *args, **kwargs)
@@ -193,6 +200,8 @@ class Flow:
             cast(Callable, functools.partial(itertools.count, 1))
         )  # type: Dict[str, Iterator[int]]
         self.slugs = {}  # type: Dict[Task, str]
+        # the set of slugs in use, kept alongside `slugs` for fast membership checks
+        self._slug_values = set()  # type: Set[str]
         self.constants = collections.defaultdict(
             dict
         )  # type: Dict[Task, Dict[str, Any]]
@@ -224,6 +233,8 @@ class Flow:
         super().__init__()
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if type(self) == type(other):
             s = (self.name, self.tasks, self.edges, self.reference_tasks())
             o = (other.name, other.tasks, other.edges, other.reference_tasks())
@@ -237,6 +248,12 @@ class Flow:
     def __iter__(self) -> Iterable[Task]:
         yield from self.sorted_tasks()
 
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        # flows pickled by earlier versions do not track the set of slug values
+        if "_slug_values" not in state:
+            self._slug_values = set(self.slugs.values())
+
     def copy(self) -> "Flow":
         """
         Create and returns a copy of the current Flow.
@@ -248,6 +265,7 @@ class Flow:
         new.tasks = self.tasks.copy()
         new.edges = self.edges.copy()
         new.slugs = self.slugs.copy()
+        new._slug_values = self._slug_values.copy()
         new.set_reference_tasks(self._reference_tasks)
         return new
 
@@ -274,18 +292,20 @@ class Flow:
         Returns:
             - [Task]: a list of tasks that meet the required conditions
         """
+        # build the set of tags once instead of once per task; this also means any
+        # iterable of tags (e.g. a generator) can be used
+        tag_set = set(tags) if tags is not None else None
 
         def sieve(t: Task) -> bool:
-            keep = True
-            if name is not None:
-                keep &= t.name == name
-            if slug is not None:
-                keep &= t.slug == slug
-            if tags is not None:
-                keep &= t.tags.issuperset(tags)
-            if task_type is not None:
-                keep &= isinstance(t, task_type)
-            return keep
+            if name is not None and t.name != name:
+                return False
+            if slug is not None and t.slug != slug:
+                return False
+            if tag_set is not None and not t.tags.issuperset(tag_set):
+                return False
+            if task_type is not None and not isinstance(t, task_type):
+                return False
+            return True
 
         keep_tasks = filter(sieve, self.tasks)
         return list(keep_tasks)
@@ -311,7 +331,7 @@ class Flow:
 
         # update tasks
         self.tasks.remove(old)
-        self.slugs.pop(old)
+        self._slug_values.discard(self.slugs.pop(old))
         self.add_task(new)
 
         self._cache.clear()
@@ -509,7 +529,7 @@ class Flow:
         while True:
             ind = next(self._slug_counters[prefix])
             slug = f"{prefix}-{ind}"
-            if slug not in self.slugs.values():
+            if slug not in self._slug_values:
                 return slug
 
     def add_task(self, task: Task) -> Task:
@@ -532,12 +552,13 @@ class Flow:
                 "Tasks must be Task instances (received {})".format(type(task))
             )
         elif task not in self.tasks:
-            if task.slug and task.slug in self.slugs.values():
+            if task.slug and task.slug in self._slug_values:
                 raise ValueError(
                     'A task with the slug "{}" already exists in this '
                     "flow.".format(task.slug)
                 )
             self.slugs[task] = task.slug or self._generate_task_slug(task)
+            self._slug_values.add(self.slugs[task])
 
             self.tasks.add(task)
             self._cache.clear()
@@ -677,13 +698,22 @@ class Flow:
         Returns:
             - A list of Edge objects added to the flow
         """
+        if validate is None:
+            validate = cast(bool, prefect.config.flows.eager_edge_validation)
+
+        # chained edges have no keys, so the only validation needed is the check
+        # for cycles which is performed once after all of the edges are added
         edges = []
         for u_task, d_task in zip(tasks, tasks[1:]):
             edges.append(
                 self.add_edge(
-                    upstream_task=u_task, downstream_task=d_task, validate=validate
+                    upstream_task=u_task, downstream_task=d_task, validate=False
                 )
             )
+
+        if validate:
+            self.validate()
+
         return edges
 
     def update(
@@ -891,51 +921,56 @@ class Flow:
                     )
 
             tasks = set(root_tasks)
-            seen = set()  # type: Set[Task]
 
             # compute the downstream edges dict once, this method uses
             # @cached but validation is expensive for large flows
             downstream_edges = self.all_downstream_edges()
 
-            # while the set of tasks is different from the seen tasks...
-            while tasks.difference(seen):
-                # iterate over the new tasks...
-                for t in list(tasks.difference(seen)):
-                    # add its downstream tasks to the task list
-                    tasks.update({e.downstream_task for e in downstream_edges[t]})
-                    # mark it as seen
-                    seen.add(t)
+            # walk downstream from the root tasks, visiting each task only once
+            to_visit = list(tasks)
+            while to_visit:
+                t = to_visit.pop()
+                for edge in downstream_edges[t]:
+                    if edge.downstream_task not in tasks:
+                        tasks.add(edge.downstream_task)
+                        to_visit.append(edge.downstream_task)
         else:
             tasks = self.tasks
 
         # build the list of sorted tasks
         remaining_tasks = list(tasks)
+        # the same tasks as a set, for fast membership checks
+        remaining = set(remaining_tasks)
         sorted_tasks = []
 
         # compute the upstream edges dict once, this method uses
         # @cached but validation is expensive for large flows
         upstream_edges = self.all_upstream_edges()
+        upstream_tasks = {
+            task: {e.upstream_task for e in upstream_edges[task]}
+            for task in remaining_tasks
+        }
 
         while remaining_tasks:
             # mark the flow as cyclic unless we prove otherwise
             cyclic = True
+            unsorted_tasks = []
 
             # iterate over each remaining task
-            for task in remaining_tasks.copy():
-                # check all the upstream tasks of that task
-                upstream_tasks = {e.upstream_task for e in upstream_edges[task]}
-                for upstream_task in upstream_tasks:
-                    # if the upstream task is also remaining, it means it
-                    # hasn't been sorted, so we can't sort this task either
-                    if upstream_task in remaining_tasks:
-                        break
+            for task in remaining_tasks:
+                # if any upstream task is also remaining, it means it hasn't been
+                # sorted, so we can't sort this task either
+                if not remaining.isdisjoint(upstream_tasks[task]):
+                    unsorted_tasks.append(task)
                 else:
                     # but if all upstream tasks have been sorted, we can sort
                     # this one too. We note that we found no cycle this time.
                     cyclic = False
-                    remaining_tasks.remove(task)
+                    remaining.remove(task)
                     sorted_tasks.append(task)
 
+            remaining_tasks = unsorted_tasks
+
             # if we were unable to match any upstream tasks, we have a cycle
             if cyclic:
                 raise ValueError("Cycle found; flows must be acyclic!")
@@ -1476,11 +1511,10 @@ class Flow:
         # each task has its slug attached as an attribute.  We don't perform this
         # update when the task is added to the flow because the task might get used
         # within another flow (and hence have a different slug)
-        flow_copy = self.copy()
-        for task, slug in flow_copy.slugs.items():
+        for task, slug in self.slugs.items():
             task.slug = slug
 
-        serialized = schema(exclude=["storage"]).dump(flow_copy)
+        serialized = schema(exclude=["storage"]).dump(self)
 
         if build:
             if not self.storage:
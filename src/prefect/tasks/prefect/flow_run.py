@@ -437,7 +437,7 @@ class StartFlowRun(Task):
 
         while True:
             time.sleep(self.poll_interval.total_seconds())
-            flow_run_state = client.get_flow_run_info(flow_run_id).state
+            flow_run_state = client.get_flow_run_state(flow_run_id)
             if flow_run_state.is_finished():
                 exc = signal_from_state(flow_run_state)(
                     f"{flow_run_id} finished in state {flow_run_state}"
@@ -127,8 +127,10 @@ class Context(DotDict, threading.local):
             self.update(new_context)  # type: ignore
             yield self
         finally:
-            self.clear()
-            self.update(previous_context)
+            # restore the underlying dict directly; the generic `MutableMapping`
+            # methods would otherwise remove and re-add every key one at a time
+            self.__dict__.clear()
+            self.__dict__.update(previous_context)
 
 
 context = Context()
@@ -33,25 +33,30 @@ def is_serializable(obj: Any, raise_on_error: bool = False) -> bool:
 
     template = textwrap.dedent(
         """
+        import sys
+        sys.path[0] = '{0}'
+
         import cloudpickle
 
-        with open('{}', 'rb') as z76123:
+        with open('{1}', 'rb') as z76123:
             res = cloudpickle.load(z76123)
         """
     )
+    # write the pickle through the descriptor `mkstemp` already opened and pass the
+    # loading script inline rather than through a second temporary file; `-c` puts
+    # the caller's working directory on `sys.path`, so the script replaces it with
+    # the temp directory just as running a script file from there would
     bd, binary_file = tempfile.mkstemp()
-    sd, script_file = tempfile.mkstemp()
-    os.close(bd)
-    os.close(sd)
     try:
-        with open(binary_file, "wb") as bf:
+        with os.fdopen(bd, "wb") as bf:
             cloudpickle.dump(obj, bf)
-        with open(script_file, "w") as sf:
-            sf.write(template.format(binary_file))
         try:
             subprocess.check_output(
-                "{} {}".format(sys.executable, script_file),
-                shell=True,
+                [
+                    sys.executable,
+                    "-c",
+                    template.format(os.path.dirname(binary_file), binary_file),
+                ],
                 stderr=subprocess.STDOUT,
             )
         except subprocess.CalledProcessError as exc:
@@ -64,7 +69,6 @@ def is_serializable(obj: Any, raise_on_error: bool = False) -> bool:
         return False
     finally:
         os.unlink(binary_file)
-        os.unlink(script_file)
     return True
 
 
@@ -310,13 +310,18 @@ def test_mark_flow_as_submitted(monkeypatch, cloud_api, with_task_runs):
     )
 
     if with_task_runs:
-        agent.client.set_task_run_state.assert_called_once_with(
-            task_run_id="task-id",
-            version=1,
-            state=Submitted(message="Submitted for execution"),
+        agent.client.set_task_run_states.assert_called_once_with(
+            [
+                dict(
+                    task_run_id="task-id",
+                    version=1,
+                    state=Submitted(message="Submitted for execution"),
+                )
+            ]
         )
     else:
-        agent.client.set_task_run_state.assert_not_called()
+        agent.client.set_task_run_states.assert_not_called()
+    agent.client.set_task_run_state.assert_not_called()
 
 
 def test_mark_flow_as_failed(monkeypatch, cloud_api):
@@ -210,17 +210,71 @@ def test_flow_run_view_get_all_task_runs(patch_post, patch_posts):
     )
     flow_run = FlowRunView.from_flow_run_id("fake-id")
 
-    patch_post({"data": {"task_run": [TASK_RUN_DATA_FINISHED, TASK_RUN_DATA_RUNNING]}})
+    patch_posts(
+        [
+            {"data": {"task_run_aggregate": {"aggregate": {"count": 2}}}},
+            {"data": {"task_run": [TASK_RUN_DATA_FINISHED, TASK_RUN_DATA_RUNNING]}},
+        ]
+    )
     tr = flow_run.get_all_task_runs()
     assert len(flow_run._cached_task_runs) == 1
     assert len(tr) == 2
 
-    patch_post({"data": {"task_run": [TASK_RUN_DATA_RUNNING_NOW_FINISHED]}})
+    # The flow run is finished so the task run count is not requested again
+    patch_posts([{"data": {"task_run": [TASK_RUN_DATA_RUNNING_NOW_FINISHED]}}])
     tr = flow_run.get_all_task_runs()
     assert len(flow_run._cached_task_runs) == 2
     assert len(tr) == 2
 
 
+def test_flow_run_view_get_all_task_runs_caches_count_for_finished_flow_run(
+    patch_posts,
+):
+    patch_posts(
+        [
+            {"data": {"flow_run": [FLOW_RUN_DATA_1]}},
+            {"data": {"task_run": []}},
+        ]
+    )
+    flow_run = FlowRunView.from_flow_run_id("fake-id")
+
+    post = patch_posts(
+        [
+            {"data": {"task_run_aggregate": {"aggregate": {"count": 1}}}},
+            {"data": {"task_run": [TASK_RUN_DATA_RUNNING]}},
+            {"data": {"task_run": [TASK_RUN_DATA_RUNNING_NOW_FINISHED]}},
+        ]
+    )
+    flow_run.get_all_task_runs()
+    flow_run.get_all_task_runs()
+
+    # The count is only requested on the first call
+    queries = [call[1]["json"]["query"] for call in post.call_args_list]
+    assert len(queries) == 3
+    assert "task_run_aggregate" in queries[0]
+    assert not any("task_run_aggregate" in query for query in queries[1:])
+
+
+def test_flow_run_view_get_all_task_runs_counts_task_runs_in_backend(
+    patch_post, patch_posts
+):
+    patch_posts(
+        [
+            {"data": {"flow_run": [FLOW_RUN_DATA_1]}},
+            {"data": {"task_run": [TASK_RUN_DATA_FINISHED]}},
+        ]
+    )
+    flow_run = FlowRunView.from_flow_run_id("fake-id")
+
+    post = patch_post({"data": {"task_run_aggregate": {"aggregate": {"count": 1001}}}})
+    with pytest.raises(ValueError, match="more than 1000 tasks"):
+        flow_run.get_all_task_runs()
+
+    # Only the count is requested, not the task run ids
+    assert post.call_count == 1
+    assert "task_run_aggregate" in post.call_args[1]["json"]["query"]
+
+
 def test_flow_run_view_get_latest_returns_new_instance(patch_post, patch_posts):
     patch_posts(
         [
@@ -82,6 +82,15 @@ def test_task_run_view_query_for_task_runs_uses_order_by_in_query(monkeypatch):
     )
 
 
+def test_task_run_view_query_for_task_runs_uses_limit_in_query(monkeypatch):
+    post = MagicMock(return_value={"data": {"task_run": [TASK_RUN_DATA_1]}})
+    monkeypatch.setattr("prefect.client.client.Client.post", post)
+
+    TaskRunView._query_for_task_runs(where={}, limit=10)
+
+    assert "task_run(where: {}, limit: 10)" in post.call_args[1]["params"]["query"]
+
+
 def test_task_run_view_query_for_task_runs_includes_all_required_data(monkeypatch):
     graphql = MagicMock(return_value={"data": {"task_run": [TASK_RUN_DATA_1]}})
     monkeypatch.setattr("prefect.client.client.Client.graphql", graphql)
@@ -356,52 +365,69 @@ def test_task_run_view_iter_mapped():
     map_1["map_index"] = 0
     map_2 = TASK_RUN_DATA_2.copy()
     map_2["map_index"] = 1
+    map_3 = TASK_RUN_DATA_1.copy()
+    map_3["map_index"] = 2
 
     # We'll mock the query so we can assert its called correctly and returns the
     # mock data
-    return_data = [map_1, map_2, None]
+    return_data = [map_1, map_2, map_3]
 
-    def return_index(*args, **kwargs):
-        index = kwargs.get("where", {}).get("map_index", {}).get("_eq")
+    def return_batch(*args, **kwargs):
+        index = kwargs.get("where", {}).get("map_index", {}).get("_gte")
         if index is None:
             raise ValueError("iter_mapped did not include a map index in where query")
-        return return_data[index]
+        return return_data[index : index + kwargs["limit"]]
 
-    query_mock = MagicMock(side_effect=return_index)
-    task_run._query_for_task_run = query_mock
+    query_mock = MagicMock(side_effect=return_batch)
+    task_run._query_for_task_runs = query_mock
 
     # Yields each mapped task
-    for index, child_run in enumerate(task_run.iter_mapped()):
+    child_runs = list(task_run.iter_mapped(batch_size=2))
+    assert len(child_runs) == 3
+    for index, child_run in enumerate(child_runs):
         assert isinstance(child_run, TaskRunView)
         assert child_run.map_index == index
 
-    # Queries in order for each task run
-    query_mock.assert_has_calls(
-        [
-            call(
-                where={
-                    "task": {"slug": {"_eq": task_run.task_slug}},
-                    "flow_run_id": {"_eq": task_run.flow_run_id},
-                    "map_index": {"_eq": 0},
-                },
-                error_on_empty=False,
-            ),
-            call(
-                where={
-                    "task": {"slug": {"_eq": task_run.task_slug}},
-                    "flow_run_id": {"_eq": task_run.flow_run_id},
-                    "map_index": {"_eq": 1},
-                },
-                error_on_empty=False,
-            ),
-            # This query fails but is still made to check that the end is reached
-            call(
-                where={
-                    "task": {"slug": {"_eq": task_run.task_slug}},
-                    "flow_run_id": {"_eq": task_run.flow_run_id},
-                    "map_index": {"_eq": 2},
-                },
-                error_on_empty=False,
-            ),
-        ]
+    # Queries in order for each batch of task runs
+    assert query_mock.call_args_list == [
+        call(
+            where={
+                "task": {"slug": {"_eq": task_run.task_slug}},
+                "flow_run_id": {"_eq": task_run.flow_run_id},
+                "map_index": {"_gte": 0},
+            },
+            order_by={"map_index": EnumValue("asc")},
+            limit=2,
+            error_on_empty=False,
+        ),
+        # This batch is not full so the end has been reached
+        call(
+            where={
+                "task": {"slug": {"_eq": task_run.task_slug}},
+                "flow_run_id": {"_eq": task_run.flow_run_id},
+                "map_index": {"_gte": 2},
+            },
+            order_by={"map_index": EnumValue("asc")},
+            limit=2,
+            error_on_empty=False,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_task_run_view_iter_mapped_requires_a_positive_batch_size(batch_size):
+    task_run = TaskRunView(
+        task_run_id="fake-id",
+        task_id=None,
+        task_slug="fake-slug",
+        name=None,
+        state=Mapped(map_states=[]),
+        map_index=-1,
+        flow_run_id="fake-flow-run-id",
     )
+    task_run._query_for_task_runs = MagicMock()
+
+    with pytest.raises(ValueError, match="`batch_size` must be at least 1"):
+        list(task_run.iter_mapped(batch_size=batch_size))
+
+    task_run._query_for_task_runs.assert_not_called()
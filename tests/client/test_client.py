@@ -1,9 +1,11 @@
 import datetime
 import json
 from pathlib import Path
+import threading
 import uuid
 from unittest.mock import MagicMock
 
+import cloudpickle
 import marshmallow
 import pendulum
 import pytest
@@ -309,6 +311,62 @@ def test_version_header_cant_be_overridden(monkeypatch):
     )
 
 
+def test_client_reuses_session_across_requests(monkeypatch):
+    session = MagicMock()
+    monkeypatch.setattr("requests.Session", session)
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+    client.get("/foo/bar")
+    client.post("/foo/bar")
+    client.get("/foo/bar")
+
+    assert session.call_count == 1
+    assert session.return_value.get.call_count == 2
+    assert session.return_value.post.call_count == 1
+
+
+def test_client_uses_a_session_per_thread(monkeypatch):
+    monkeypatch.setattr("requests.Session", MagicMock(side_effect=MagicMock))
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(client._get_session()))
+    thread.start()
+    thread.join()
+
+    assert client._get_session() is client._get_session()
+    assert sessions[0] is not client._get_session()
+
+
+def test_client_can_be_pickled_with_sessions(monkeypatch):
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+        client._get_session()
+
+        new_client = cloudpickle.loads(cloudpickle.dumps(client))
+        assert new_client.api_server == client.api_server
+        assert new_client._get_session() is not client._get_session()
+
+
 def test_client_attached_headers(monkeypatch, cloud_api):
     get = MagicMock()
     session = MagicMock()
@@ -556,6 +614,40 @@ def test_client_register(patch_post, compressed, monkeypatch, tmpdir):
     assert flow_id == "long-id"
 
 
+@pytest.mark.parametrize("n_tasks", [1, 500, 501])
+def test_client_register_sends_only_nonempty_batches(
+    patch_post, n_tasks, monkeypatch, tmpdir
+):
+    post = patch_post(
+        {"data": {"project": [{"id": "proj-id"}], "create_flow": {"id": "long-id"}}}
+    )
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+    flow = prefect.Flow(
+        name="test",
+        storage=prefect.storage.Local(tmpdir),
+        tasks=[prefect.Task() for _ in range(n_tasks)],
+    )
+    flow.result = flow.storage.result
+
+    client.register(
+        flow, project_name="my-default-project", compressed=False, no_url=True
+    )
+
+    queries = [c[1]["json"]["query"] for c in post.call_args_list]
+    task_batches = [q for q in queries if "register_tasks" in q]
+    assert len(task_batches) == (1 if n_tasks <= 500 else 2)
+    # the flow has no edges so none are registered
+    assert not any("register_edges" in q for q in queries)
+
+
 @pytest.mark.parametrize("compressed", [True, False])
 def test_client_register_raises_for_keyed_flows_with_no_result(
     patch_post, compressed, monkeypatch, tmpdir
@@ -1556,6 +1648,57 @@ def test_set_task_run_state_responds_to_config_when_queued(patch_post):
     assert result.start_time >= pendulum.now("UTC").add(seconds=749)
 
 
+def test_set_task_run_states_sends_a_single_request(patch_post):
+    response = {
+        "data": {
+            "set_task_run_states": {
+                "states": [{"status": "SUCCESS"}, {"status": "QUEUED"}]
+            }
+        }
+    }
+    post = patch_post(response)
+    state_1, state_2 = Pending(), Pending()
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+    result = client.set_task_run_states(
+        [
+            dict(task_run_id="76-salt", version=0, state=state_1),
+            dict(task_run_id="77-salt", state=state_2),
+        ]
+    )
+
+    assert post.call_count == 1
+    states = json.loads(post.call_args[1]["json"]["variables"])["input"]["states"]
+    assert [s["task_run_id"] for s in states] == ["76-salt", "77-salt"]
+    assert [s["version"] for s in states] == [0, None]
+
+    assert result[0] is state_1
+    assert result[1].is_queued()
+
+
+def test_set_task_run_states_with_no_states_sends_no_request(patch_post):
+    post = patch_post({})
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    assert client.set_task_run_states([]) == []
+    assert not post.called
+
+
 def test_set_task_run_state_with_error(patch_post):
     response = {
         "data": {"set_task_run_states": None},
@@ -1641,6 +1784,136 @@ def test_create_flow_run_with_input(patch_post, use_flow_id, use_extra_args):
     assert variables["input"] == expected
 
 
+def test_create_flow_runs_sends_a_single_request(patch_post):
+    response = {
+        "data": {
+            "flow_run_0": {"id": "FOO"},
+            "flow_run_1": {"id": "BAR"},
+        },
+    }
+    post = patch_post(response)
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    flow_run_ids = client.create_flow_runs(
+        [
+            {"flow_id": "my-flow-id", "parameters": {"x": 1}},
+            {"version_group_id": "my-version-group-id", "run_name": "my-run-name"},
+        ]
+    )
+
+    assert flow_run_ids == ["FOO", "BAR"]
+    assert post.call_count == 1
+
+    query = post.call_args[1]["json"]["query"]
+    assert "flow_run_0: create_flow_run(input: $input_0)" in query
+    assert "flow_run_1: create_flow_run(input: $input_1)" in query
+
+    variables = json.loads(post.call_args[1]["json"]["variables"])
+    assert variables == {
+        "input_0": {"flow_id": "my-flow-id", "parameters": {"x": 1}},
+        "input_1": {
+            "version_group_id": "my-version-group-id",
+            "flow_run_name": "my-run-name",
+        },
+    }
+
+
+def test_create_flow_runs_reports_created_flow_runs_on_partial_errors(patch_post):
+    response = {
+        "data": {
+            "flow_run_0": {"id": "FOO"},
+            "flow_run_1": None,
+        },
+        "errors": [{"message": "Version group not found", "path": ["flow_run_1"]}],
+    }
+    patch_post(response)
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    with pytest.raises(ClientError) as exc:
+        client.create_flow_runs(
+            [
+                {"flow_id": "my-flow-id"},
+                {"version_group_id": "bad-version-group-id"},
+            ]
+        )
+
+    assert "Created 1 of 2 flow runs" in str(exc.value)
+    assert "{0: 'FOO'}" in str(exc.value)
+    assert "Version group not found" in str(exc.value)
+
+
+def test_create_flow_runs_raises_graphql_errors_if_no_flow_runs_are_created(
+    patch_post,
+):
+    response = {
+        "data": None,
+        "errors": [{"message": "Version group not found", "path": ["flow_run_0"]}],
+    }
+    patch_post(response)
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    with pytest.raises(ClientError, match="Version group not found") as exc:
+        client.create_flow_runs([{"version_group_id": "bad-version-group-id"}])
+
+    assert "Created" not in str(exc.value)
+
+
+def test_create_flow_runs_with_no_flow_runs_sends_no_request(patch_post):
+    post = patch_post({})
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    assert client.create_flow_runs([]) == []
+    assert not post.called
+
+
+def test_create_flow_runs_requires_flow_id_or_version_group_id():
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+
+    with pytest.raises(
+        ValueError, match="flow_id or version_group_id must be provided"
+    ):
+        client.create_flow_runs([{"flow_id": "my-flow-id"}, {"labels": ["b"]}])
+
+
 def test_get_default_tenant_slug_as_user(patch_post):
     response = {
         "data": {"user": [{"default_membership": {"tenant": {"slug": "tslug"}}}]}
@@ -1714,6 +1987,36 @@ def test_get_default_tenant_slug_not_as_user_with_no_tenant_id(patch_post):
         assert slug == "firstslug"
 
 
+def test_get_default_tenant_slug_is_cached_per_tenant(patch_post):
+    response = {
+        "data": {
+            "tenant": [
+                {"slug": "tslug", "id": "tenant-id"},
+                {"slug": "otherslug", "id": "other-id"},
+            ]
+        }
+    }
+
+    post = patch_post(response)
+
+    with set_temporary_config(
+        {
+            "cloud.api": "http://my-cloud.foo",
+            "cloud.auth_token": "secret_token",
+            "cloud.tenant_id": "tenant-id",
+            "backend": "cloud",
+        }
+    ):
+        client = Client()
+        assert client.get_default_tenant_slug() == "tslug"
+        assert client.get_default_tenant_slug() == "tslug"
+        assert post.call_count == 1
+
+        client.tenant_id = "other-id"
+        assert client.get_default_tenant_slug() == "otherslug"
+        assert post.call_count == 2
+
+
 def test_get_cloud_url_as_user(patch_post, cloud_api):
     response = {
         "data": {"user": [{"default_membership": {"tenant": {"slug": "tslug"}}}]}
@@ -1878,6 +2181,9 @@ def test_artifacts_client_functions(patch_post, cloud_api):
 
     patch_post(response)
 
+    # the client holds on to its session, so create a new one to pick up the patch
+    client = Client()
+
     with pytest.raises(ValueError):
         client.create_task_run_artifact(
             task_run_id="tr_id", kind="kind", data={"test": "data"}, tenant_id="t_id"
@@ -472,28 +472,40 @@ def test_chain():
     assert f.edges == set(edges)
 
 
-def test_splatting_chain_works_in_flow_context_without_duplication():
+@pytest.mark.parametrize("n_tasks", [4, 10])
+def test_chain_works_in_flow_context_without_duplication(n_tasks):
     @task
     def do_nothing():
         pass
 
     with Flow(name="test") as f:
-        f.chain(*[do_nothing() for _ in range(10)])
+        # a mix of called tasks and a plain task, splatted from a list
+        f.chain(*[do_nothing() for _ in range(n_tasks - 1)], Task())
 
-    assert len(f.tasks) == 10
-    assert len(f.edges) == 9
+    assert len(f.tasks) == n_tasks
+    assert len(f.edges) == n_tasks - 1
 
 
-def test_chain_works_in_flow_context_without_duplication():
-    @task
-    def do_nothing():
-        pass
+def test_chain_validates_flow_once(monkeypatch):
+    validate = MagicMock()
+    monkeypatch.setattr("prefect.core.flow.Flow.validate", validate)
 
-    with Flow(name="test") as f:
-        f.chain(do_nothing(), do_nothing(), do_nothing(), Task())
+    f = Flow(name="test")
+    f.chain(*[Task() for _ in range(10)], validate=True)
 
-    assert len(f.tasks) == 4
-    assert len(f.edges) == 3
+    assert len(f.edges) == 9
+    assert validate.call_count == 1
+
+
+def test_chain_detects_cycles_when_validating():
+    f = Flow(name="test")
+    t1 = Task()
+    t2 = Task()
+    t3 = Task()
+    f.add_edge(t3, t1)
+
+    with pytest.raises(ValueError, match="Cycle found"):
+        f.chain(t1, t2, t3, validate=True)
 
 
 def test_iter():
@@ -1151,6 +1163,29 @@ def test_sorted_tasks_with_start_task():
     assert set(f.sorted_tasks(root_tasks=[t3])) == set([t3, t4, t5])
 
 
+def test_sorted_tasks_with_start_tasks_includes_all_downstream_tasks():
+    """
+    t1 -> t2 -> t4 -> ... -> t103
+    t1 -> t3 -> t4
+    t0 -> t2
+    """
+    f = Flow(name="test")
+    t0, t1, t2, t3 = Task("0"), Task("1"), Task("2"), Task("3")
+    f.add_edge(t0, t2)
+    f.add_edge(t1, t2)
+    f.add_edge(t1, t3)
+    chain = [Task(str(i)) for i in range(4, 104)]
+    f.add_edge(t2, chain[0])
+    f.add_edge(t3, chain[0])
+    f.chain(*chain)
+
+    tasks = f.sorted_tasks(root_tasks=[t1])
+    assert set(tasks) == {t1, t2, t3, *chain}
+    assert tasks[0] is t1
+    assert set(tasks[1:3]) == {t2, t3}
+    assert tasks[3:] == tuple(chain)
+
+
 def test_sorted_tasks_with_invalid_start_task():
     """
     t1 -> t2 -> t3 -> t4
@@ -1812,6 +1847,12 @@ class TestGetTasks:
         f = Flow(name="test", tasks=[t1, t2])
         assert f.get_tasks(tags=["a", "b"]) == [t1]
 
+    def test_get_tasks_accepts_tags_from_a_generator(self):
+        t1, t2 = Task(name="t1", tags=["a"]), Task(name="t2", tags=["a"])
+        t3 = Task(name="t3", tags=["a", "b"])
+        f = Flow(name="test", tasks=[t1, t2, t3])
+        assert f.get_tasks(tags=(tag for tag in ["a", "b"])) == [t3]
+
     def test_get_tasks_can_check_types(self):
         class Specific(Task):
             pass
@@ -3308,6 +3349,18 @@ class TestSlugGeneration:
 
         assert flow.slugs == {a1: "a-1", a2: "a-2", a3: "a-3", a4: "a-4"}
 
+    def test_slugs_added_to_a_copy_are_not_in_use_by_the_original(self):
+        flow = Flow("test")
+        flow.add_task(Task("a"))
+        flow_copy = flow.copy()
+        flow_copy.add_task(Task("b", slug="b"))
+
+        b = Task("b", slug="b")
+        flow.add_task(b)
+        assert flow.slugs[b] == "b"
+        with pytest.raises(ValueError, match="already exists"):
+            flow_copy.add_task(Task("b", slug="b"))
+
     def test_slugs_robust_to_task_name_changes(self):
         "See https://github.com/PrefectHQ/prefect/issues/4185"
         with Flow("test") as flow:
@@ -3319,6 +3372,29 @@ class TestSlugGeneration:
 
         assert flow.slugs == {a1: "a-1", a2: "a-2"}
 
+    def test_slugs_tracked_for_flows_pickled_without_slug_values(self):
+        flow = Flow("test")
+        a1 = Task("a")
+        flow.add_task(a1)
+        flow.add_task(Task("b", slug="b"))
+        # flows pickled by earlier versions don't have the `_slug_values` attribute
+        del flow._slug_values
+
+        flow = cloudpickle.loads(cloudpickle.dumps(flow))
+        assert flow._slug_values == {"a-1", "b"}
+
+        a2 = Task("a")
+        flow.add_task(a2)
+        assert flow.slugs[a2] == "a-2"
+        with pytest.raises(ValueError, match="already exists"):
+            flow.add_task(Task("b", slug="b"))
+
+        flow_copy = flow.copy()
+        assert flow_copy._slug_values == {"a-1", "a-2", "b"}
+
+        flow.replace(a2, Task("c"))
+        assert flow._slug_values == {"a-1", "b", "c-1"}
+
 
 class TestTerminalStateHandler:
     def test_terminal_state_handler_determines_final_state(self):
@@ -284,6 +284,7 @@ def client(monkeypatch):
                 context={},
             )
         ),
+        get_flow_run_state=MagicMock(return_value=state.Success()),
     )
     monkeypatch.setattr(
         "prefect.tasks.prefect.flow_run.Client", MagicMock(return_value=cloud_client)
@@ -483,6 +484,9 @@ class TestStartFlowRunServer:
         assert isinstance(flow_state_signal.state, state.Success)
         # Check flow ID
         assert str(flow_state_signal).split(" ")[0] == "xyz890"
+        # The state is polled without loading the rest of the flow run
+        client.get_flow_run_state.assert_called_with("xyz890")
+        client.get_flow_run_info.assert_not_called()
         # verify the GraphQL query was called with the correct arguments
         query_args = list(client.graphql.call_args_list[0][0][0]["query"].keys())[0]
         assert "Test Flow" in query_args
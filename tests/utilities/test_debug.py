@@ -1,7 +1,5 @@
-import os
 import subprocess
 import sys
-import tempfile
 import textwrap
 
 import pytest
@@ -35,18 +33,7 @@ class MathTask(Task):
 
 
 def assert_script_runs(script):
-    sd, script_file = tempfile.mkstemp()
-    os.close(sd)
-    try:
-        with open(script_file, "w") as sf:
-            sf.write(script)
-        subprocess.check_output(
-            "python {}".format(script_file), shell=True, stderr=subprocess.STDOUT
-        )
-    except Exception as exc:
-        raise exc
-    finally:
-        os.unlink(script_file)
+    subprocess.check_output([sys.executable, "-c", script], stderr=subprocess.STDOUT)
 
 
 def test_raise_on_exception_raises_basic_error():
@@ -160,6 +147,45 @@ def test_is_serializable_returns_true_for_basic_objects(obj):
     assert is_serializable(obj) is True
 
 
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="is_serializable is not supported on Windows"
+)
+def test_is_serializable_returns_false_for_objects_from_modules_in_the_cwd(
+    tmpdir, monkeypatch
+):
+    tmpdir.join("localmod.py").write("class Thing:\n    pass\n")
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.delitem(sys.modules, "localmod", raising=False)
+
+    import localmod
+
+    try:
+        assert is_serializable(localmod.Thing()) is False
+    finally:
+        sys.modules.pop("localmod", None)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="is_serializable is not supported on Windows"
+)
+def test_is_serializable_returns_true_for_objects_from_relative_pythonpath_entries(
+    tmpdir, monkeypatch
+):
+    tmpdir.mkdir("src").join("relmod.py").write("class Thing:\n    pass\n")
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setenv("PYTHONPATH", "src")
+    monkeypatch.syspath_prepend(str(tmpdir.join("src")))
+    monkeypatch.delitem(sys.modules, "relmod", raising=False)
+
+    import relmod
+
+    try:
+        assert is_serializable(relmod.Thing()) is True
+    finally:
+        sys.modules.pop("relmod", None)
+
+
 @pytest.mark.skipif(
     sys.platform == "win32", reason="is_serializable is not supported on Windows"
 )